@@ -1,52 +1,138 @@
-from typing import Dict, List
+from typing import AsyncIterator, Dict, Iterator, List
 from linkedin_api import Linkedin
-from typing import Optional, Union, Literal
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from typing import Optional, Union, Literal, Mapping, Tuple
 from urllib.parse import quote, urlencode
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from types import MappingProxyType
+import asyncio
+import copy
+import hashlib
+import inspect
 import logging
 import json
+import orjson
+import random
+import threading
+import time
 
 # set log to all debug
 logging.basicConfig(level=logging.INFO)
 
+_parse = orjson.loads
+
+_JOB_POSTING_TYPE = "com.linkedin.voyager.dash.jobs.JobPosting"
+_DEFAULT_LISTED_AT = 24 * 60 * 60  # seconds, see `search_jobs`
+_LIST_FMT = "List({})".format  # Rest.li list syntax of a selected filter
+
+# accepted values of the `experience`, `job_type` and `remote` search filters, see `search_jobs`
+_Experience = List[Literal["1", "2", "3", "4", "5", "6"]]
+_JobType = List[Literal["F", "C", "P", "T", "I", "V", "O"]]
+_Remote = List[Literal["1", "2", "3"]]
+
+# error logged when the easy apply form request fails with a given status code
+_EASY_APPLY_STATUS_MESSAGES = {
+    409: "Failed to fetch fields for easy apply job because already applied to this job!",
+}
+
+# options field of an easy apply form component -> extractor of the option texts, in lookup order
+_OPTION_EXTRACTORS = {
+    "textSelectableOptions": lambda options: [opt["optionText"]["text"] for opt in options],
+    "selectableOptions": lambda options: [
+        opt["textSelectableOption"]["optionText"]["text"] for opt in options
+    ],
+}
+
+
+def _serialize_query(query: Dict[str, Union[str, Dict[str, str]]]) -> str:
+    """Serialize a job search query into LinkedIn's `(key:value,...)` syntax.
+
+    Nested dicts become nested `(key:value,...)` groups; values are emitted as-is,
+    so free text must be quoted by the caller.
+    """
+    parts = []
+    for key, value in query.items():
+        if isinstance(value, dict):
+            value = "(" + ",".join([f"{k}:{v}" for k, v in value.items()]) + ")"
+        parts.append(f"{key}:{value}")
+    return "(" + ",".join(parts) + ")"
+
+
+def _build_query_template(keys: Tuple[str, ...]) -> str:
+    """Build a `str.format` template of a job search query carrying exactly `keys`.
+
+    `keywords` and `locationFallback` are top level fields, every other key is a selected filter.
+    """
+    query: Dict[str, Union[str, Dict[str, str]]] = {
+        "origin": "JOB_SEARCH_PAGE_QUERY_EXPANSION"
+    }
+    selected_filters: Dict[str, str] = {}
+    for key in keys:
+        target = query if key in ("keywords", "locationFallback") else selected_filters
+        target[key] = f"{{{key}}}"
+    query["selectedFilters"] = selected_filters
+    query["spellCorrectionEnabled"] = "true"
+    return _serialize_query(query)
+
 
 class LinkedInEvolvedAPI(Linkedin):
-    def __init__(self, username, password):
+    _MAX_CONCURRENT_PAGES = 8  # search pages requested in parallel per batch
+    _MAX_CONCURRENT_FIELD_FETCHES = 8  # easy apply forms requested in parallel
+    _MAX_CONCURRENT_REQUESTS = 16  # search page requests in flight across searches, the session pool size
+    _FIELDS_CACHE_SIZE = 4096  # easy apply forms kept in memory
+    _FIELDS_CACHE_TTL = 24 * 60 * 60  # seconds an on-disk easy apply form stays valid
+    _QUERY_TEMPLATES: Dict[Tuple[str, ...], str] = {}  # query templates by set of search filters
+
+    def __init__(self, username, password, fields_cache_dir: Optional[str] = None):
+        """
+        :param fields_cache_dir: directory where easy apply fields are persisted between runs, in a subdirectory per account. Disabled when None.
+        :type fields_cache_dir: str, optional
+        """
         super().__init__(username, password)
+        # every `_fetch` goes through `self.client.session`; pool its connections so
+        # concurrent pages and repeated easy apply lookups reuse TLS sessions, and retry
+        # transient failures (honouring `Retry-After`) instead of failing the whole search
+        self.client.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=self._MAX_CONCURRENT_REQUESTS,
+                pool_maxsize=self._MAX_CONCURRENT_REQUESTS,
+                max_retries=Retry(
+                    total=5,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["GET"],
+                    # hand the last response back so callers keep their own status handling
+                    raise_on_status=False,
+                ),
+            ),
+        )
+        self._easy_apply_headers: Optional[Mapping[str, str]] = None
+        self._easy_apply_session_id: Optional[str] = None
+        self._fields_cache: OrderedDict[str, List[Dict]] = OrderedDict()
+        self._fields_cache_lock = threading.Lock()
+        self._fields_in_flight: Dict[str, Future] = {}
+        self._fields_cache_dir: Optional[Path] = None
+        if fields_cache_dir:
+            # "already applied" tombstones only hold for the account that applied
+            account = hashlib.sha256(username.encode()).hexdigest()[:16]
+            self._fields_cache_dir = Path(fields_cache_dir).expanduser() / account
+            self._fields_cache_dir.mkdir(parents=True, exist_ok=True)
 
     def search_jobs(
         self,
         keywords: Optional[str] = None,
         companies: Optional[List[str]] = None,
-        experience: Optional[
-            List[
-                Union[
-                    Literal["1"],
-                    Literal["2"],
-                    Literal["3"],
-                    Literal["4"],
-                    Literal["5"],
-                    Literal["6"],
-                ]
-            ]
-        ] = None,
-        job_type: Optional[
-            List[
-                Union[
-                    Literal["F"],
-                    Literal["C"],
-                    Literal["P"],
-                    Literal["T"],
-                    Literal["I"],
-                    Literal["V"],
-                    Literal["O"],
-                ]
-            ]
-        ] = None,
+        experience: Optional[_Experience] = None,
+        job_type: Optional[_JobType] = None,
         job_title: Optional[List[str]] = None,
         industries: Optional[List[str]] = None,
         location_name: Optional[str] = None,
-        remote: Optional[List[Union[Literal["1"], Literal["2"], Literal["3"]]]] = None,
-        listed_at=24 * 60 * 60,
+        remote: Optional[_Remote] = None,
+        listed_at=_DEFAULT_LISTED_AT,
         distance: Optional[int] = None,
         easy_apply: Optional[bool] = True,
         limit=-1,
@@ -83,110 +169,467 @@ class LinkedInEvolvedAPI(Linkedin):
         :type offset: int, optional
         :return: List of jobs
         :rtype: list
+        :raises RuntimeError: if a result page cannot be fetched, even after retries
+        """
+        return list(
+            self.search_jobs_iter(
+                keywords=keywords,
+                companies=companies,
+                experience=experience,
+                job_type=job_type,
+                job_title=job_title,
+                industries=industries,
+                location_name=location_name,
+                remote=remote,
+                listed_at=listed_at,
+                distance=distance,
+                easy_apply=easy_apply,
+                limit=limit,
+                offset=offset,
+            )
+        )
+
+    def search_jobs_iter(
+        self,
+        keywords: Optional[str] = None,
+        companies: Optional[List[str]] = None,
+        experience: Optional[_Experience] = None,
+        job_type: Optional[_JobType] = None,
+        job_title: Optional[List[str]] = None,
+        industries: Optional[List[str]] = None,
+        location_name: Optional[str] = None,
+        remote: Optional[_Remote] = None,
+        listed_at=_DEFAULT_LISTED_AT,
+        distance: Optional[int] = None,
+        easy_apply: Optional[bool] = True,
+        limit=-1,
+        offset=0,
+    ) -> Iterator[Dict]:
+        """Perform a LinkedIn search for jobs, yielding them page by page.
+
+        Takes the same parameters as `search_jobs`. Pages are fetched in batches, and the
+        next batch is only requested once the caller has consumed the current one, so
+        processing the yielded jobs does not overlap later requests.
+
+        :return: Iterator of jobs
+        :rtype: iterator
+        :raises RuntimeError: if a result page cannot be fetched, even after retries
         """
-        count = Linkedin._MAX_SEARCH_COUNT
         if limit is None:
             limit = -1
 
-        query: Dict[str, Union[str, Dict[str, str]]] = {
-            "origin": "JOB_SEARCH_PAGE_QUERY_EXPANSION"
-        }
+        query_string = self._job_search_query(
+            keywords=keywords,
+            companies=companies,
+            experience=experience,
+            job_type=job_type,
+            job_title=job_title,
+            industries=industries,
+            location_name=location_name,
+            remote=remote,
+            listed_at=listed_at,
+            distance=distance,
+            easy_apply=easy_apply,
+        )
+        pages = self._iter_job_pages(
+            query_string, Linkedin._MAX_SEARCH_COUNT, limit, offset, listed_at
+        )
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                try:
+                    page = loop.run_until_complete(pages.__anext__())
+                except StopAsyncIteration:
+                    break
+                yield from page
+        finally:
+            loop.run_until_complete(pages.aclose())
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+
+    def _job_search_query(
+        self,
+        keywords: Optional[str] = None,
+        companies: Optional[List[str]] = None,
+        experience: Optional[_Experience] = None,
+        job_type: Optional[_JobType] = None,
+        job_title: Optional[List[str]] = None,
+        industries: Optional[List[str]] = None,
+        location_name: Optional[str] = None,
+        remote: Optional[_Remote] = None,
+        listed_at=_DEFAULT_LISTED_AT,
+        distance: Optional[int] = None,
+        easy_apply: Optional[bool] = True,
+    ) -> str:
+        """Return the serialized `query` parameter of a job search, see `search_jobs` for the filters."""
+        # insertion order matches the field order of the serialized query
+        values: Dict[str, str] = {}
         if keywords:
-            query["keywords"] = "KEYWORD_PLACEHOLDER"
+            values["keywords"] = quote(keywords, safe="")
         if location_name:
-            query["locationFallback"] = "LOCATION_PLACEHOLDER"
-
-        query["selectedFilters"] = {}
+            values["locationFallback"] = quote(location_name, safe="")
         if companies:
-            query["selectedFilters"]["company"] = f"List({','.join(companies)})"
+            values["company"] = _LIST_FMT(",".join(companies))
         if experience:
-            query["selectedFilters"]["experience"] = f"List({','.join(experience)})"
+            values["experience"] = _LIST_FMT(",".join(experience))
         if job_type:
-            query["selectedFilters"]["jobType"] = f"List({','.join(job_type)})"
+            values["jobType"] = _LIST_FMT(",".join(job_type))
         if job_title:
-            query["selectedFilters"]["title"] = f"List({','.join(job_title)})"
+            values["title"] = _LIST_FMT(",".join(job_title))
         if industries:
-            query["selectedFilters"]["industry"] = f"List({','.join(industries)})"
+            values["industry"] = _LIST_FMT(",".join(industries))
         if distance:
-            query["selectedFilters"]["distance"] = f"List({distance})"
+            values["distance"] = _LIST_FMT(distance)
         if remote:
-            query["selectedFilters"]["workplaceType"] = f"List({','.join(remote)})"
+            values["workplaceType"] = _LIST_FMT(",".join(remote))
         if easy_apply:
-            query["selectedFilters"]["applyWithLinkedin"] = "List(true)"
-
-        query["selectedFilters"]["timePostedRange"] = f"List(r{listed_at})"
-        query["spellCorrectionEnabled"] = "true"
-
-        query_string = (
-            str(query)
-            .replace(" ", "")
-            .replace("'", "")
-            .replace("KEYWORD_PLACEHOLDER", keywords or "")
-            .replace("LOCATION_PLACEHOLDER", location_name or "")
-            .replace("{", "(")
-            .replace("}", ")")
-        )
+            values["applyWithLinkedin"] = "List(true)"
+        values["timePostedRange"] = _LIST_FMT(f"r{listed_at}")
+
+        shape = tuple(values)
+        template = self._QUERY_TEMPLATES.get(shape)
+        if template is None:
+            template = self._QUERY_TEMPLATES[shape] = _build_query_template(shape)
+        return template.format_map(values)
+
+    def search_jobs_multi(
+        self,
+        keyword_list: List[str],
+        merge_keywords: bool = False,
+        limit=-1,
+        offset=0,
+        **kwargs,
+    ) -> List[Dict]:
+        """Perform one LinkedIn job search per keyword, sharing every other filter.
+
+        :param keyword_list: Search keywords (str), one search each
+        :type keyword_list: list
+        :param merge_keywords: combine the keywords with OR into a single search instead of running one search per keyword
+        :type merge_keywords: bool, optional. Default value is False.
+        :param limit: maximum number of results obtained per search, see `search_jobs`
+        :type limit: int, optional, default -1
+        :param offset: indicates how many search results shall be skipped in each search
+        :type offset: int, optional
+        :param kwargs: filters shared by all searches, as accepted by `search_jobs`, except `keywords`
+        :return: List of jobs, without duplicates across searches
+        :rtype: list
+        """
+        if "keywords" in kwargs:
+            raise ValueError("search_jobs_multi takes its keywords from keyword_list, not from keywords.")
+        unknown = set(kwargs).difference(inspect.signature(self._job_search_query).parameters)
+        if unknown:
+            raise TypeError(f"search_jobs_multi() got unexpected search filters: {', '.join(sorted(unknown))}")
+        if merge_keywords:
+            return self.search_jobs(
+                keywords=" OR ".join(keyword_list), limit=limit, offset=offset, **kwargs
+            )
+        if limit is None:
+            limit = -1
+
+        return asyncio.run(self._search_jobs_multi_async(keyword_list, limit, offset, kwargs))
+
+    async def _search_jobs_multi_async(
+        self, keyword_list: List[str], limit: int, offset: int, filters: Dict
+    ) -> List[Dict]:
+        """Run the searches of `search_jobs_multi` concurrently and merge their results by job ID."""
+        async def collect(pages: AsyncIterator[List[Dict]]) -> List[Dict]:
+            return [job async for page in pages for job in page]
+
+        # one budget for all searches, so their page batches never outgrow the connection pool
+        semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_REQUESTS)
+
+        searches = [
+            collect(
+                self._iter_job_pages(
+                    self._job_search_query(keywords=keywords, **filters),
+                    Linkedin._MAX_SEARCH_COUNT,
+                    limit,
+                    offset,
+                    filters.get("listed_at", _DEFAULT_LISTED_AT),
+                    semaphore,
+                )
+            )
+            for keywords in keyword_list
+        ]
+
         results = []
+        seen_job_ids = set()
+        for jobs in await asyncio.gather(*searches):
+            for job in jobs:
+                job_id = job.get("job_id")
+                if job_id is not None:
+                    if job_id in seen_job_ids:
+                        continue
+                    seen_job_ids.add(job_id)
+                results.append(job)
+        return results
+
+    async def _iter_job_pages(
+        self,
+        query_string: str,
+        count: int,
+        limit: int,
+        offset: int,
+        listed_at: Optional[Union[int, str]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> AsyncIterator[List[Dict]]:
+        """Yield the `JobPosting` elements of each search result page, in order.
+
+        Pages are fetched in concurrent batches of `_MAX_CONCURRENT_PAGES`; `semaphore`
+        bounds the requests in flight when several searches run at once. LinkedIn may
+        serve fewer results per page than requested: the batch is then cut at the first
+        short page, and the next one is planned from where that page ended, with the page
+        size the server actually honoured. Jobs are yielded at most once.
+
+        Pagination also stops at a page that repeats the previous one, which LinkedIn
+        returns past the end of the results, and at a page whose postings are all older
+        than `listed_at` seconds.
+        """
+        max_age_ms = int(listed_at) * 1000 if listed_at else None
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_REQUESTS)
+        base_params = {
+            "decorationId": "com.linkedin.voyager.dash.deco.jobs.search.JobSearchCardsCollection-174",
+            "q": "jobSearch",
+            "query": query_string,
+        }
+        # free-text values in `query_string` are already percent-encoded
+        path = f"/voyagerJobsDashJobCards?{urlencode(base_params, safe='(),:%')}"
+        fetched = 0  # number of jobs yielded so far, only used for the limit and stop checks
+        next_start = offset  # offset right after the last page accepted
+        total = None  # number of results reported by the server, once known
+        previous_page = None
+        seen_job_ids = set()
         while True:
-            if limit > -1 and limit - len(results) < count:
-                count = limit - len(results)
-            default_params = {
-                "decorationId": "com.linkedin.voyager.dash.deco.jobs.search.JobSearchCardsCollection-174",
-                "count": count,
-                "q": "jobSearch",
-                "query": query_string,
-                "start": len(results) + offset,
-            }
+            if total is not None and next_start >= total:
+                break
+            pages = []
+            start = next_start
+            remaining = limit - fetched if limit > -1 else None
+            for _ in range(self._MAX_CONCURRENT_PAGES):
+                page_count = count if remaining is None else min(count, remaining)
+                if page_count <= 0 or (total is not None and start >= total):
+                    break
+                pages.append((start, page_count))
+                start += page_count
+                if remaining is not None:
+                    remaining -= page_count
+            if not pages:
+                break
 
-            res = self._fetch(
-                f"/voyagerJobsDashJobCards?{urlencode(default_params, safe='(),:')}",
-                headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
+            batch = await asyncio.gather(
+                *(
+                    self._fetch_page(path, start, page_count, semaphore)
+                    for start, page_count in pages
+                )
             )
-            data = res.json()
-
-            elements = data.get("included", [])
-            new_data = []
-            for e in elements:
-                trackingUrn = e.get("trackingUrn")
-                if trackingUrn:
-                    trackingUrn = trackingUrn.split(":")[-1]
-                    e["job_id"] = trackingUrn
-                if e.get("$type") == "com.linkedin.voyager.dash.jobs.JobPosting":
-                    new_data.append(e)
-                
-            if not new_data:
-                break
-            results.extend(new_data)
+
+            exhausted = False
+            throttled = False
+            now_ms = time.time() * 1000
+            for i, ((start, page_count), (new_data, page_throttled, page_total)) in enumerate(
+                zip(pages, batch)
+            ):
+                throttled = throttled or page_throttled
+                if page_total is not None:
+                    total = page_total
+                if not new_data:
+                    exhausted = True
+                    break
+                # a page can only be recognised as a repeat when all its postings carry a URN
+                urns = [e.get("entityUrn") or e.get("trackingUrn") for e in new_data]
+                page = hash(tuple(urns)) if all(urns) else None
+                if page is not None and page == previous_page:
+                    exhausted = True
+                    break
+                previous_page = page
+                next_start = start + len(new_data)
+
+                new_jobs = []
+                for e in new_data:
+                    job_id = e.get("job_id")
+                    if job_id is not None:
+                        if job_id in seen_job_ids:
+                            continue
+                        seen_job_ids.add(job_id)
+                    new_jobs.append(e)
+                if new_jobs:
+                    yield new_jobs
+                    fetched += len(new_jobs)
+
+                if max_age_ms is not None and all(
+                    e.get("listedAt") and now_ms - e["listedAt"] > max_age_ms for e in new_data
+                ):
+                    exhausted = True
+                    break
+                if len(new_data) < page_count:
+                    # either the last page of the results, when the next page came back
+                    # empty, or the server caps the page size: the following pages of the
+                    # batch then started past what this one covered
+                    if i + 1 < len(batch) and not batch[i + 1][0]:
+                        exhausted = True
+                    count = len(new_data)
+                    break
             if (
-                (-1 < limit <= len(results))
-                or len(results) / count >= Linkedin._MAX_REPEATED_REQUESTS
-            ) or len(elements) == 0:
+                exhausted
+                or (-1 < limit <= fetched)
+                or fetched / count >= Linkedin._MAX_REPEATED_REQUESTS
+            ):
                 break
 
-            self.logger.debug(f"results grew to {len(results)}")
+            self.logger.debug(f"results grew to {fetched}")
+            if throttled:
+                # LinkedIn is close to rate limiting us, space out the next batch
+                await asyncio.sleep(random.uniform(0.1, 0.3))
 
-        return results
+    async def _fetch_page(
+        self, path: str, start: int, count: int, semaphore: asyncio.Semaphore
+    ) -> Tuple[List[Dict], bool, Optional[int]]:
+        """Fetch a single page of job cards from the search `path`.
+
+        Returns its `JobPosting` elements, whether the request had to be retried and the
+        total number of results reported in the page's `paging`, if any.
+        Raises `RuntimeError` when the page cannot be fetched, even after retries, so a
+        failure is never mistaken for the end of the results.
+
+        Only the filtered postings outlive this call, so a batch of pages awaiting
+        `asyncio.gather` does not keep every page's full `included` graph alive.
+        """
+        async with semaphore:
+            res = await asyncio.to_thread(
+                self._fetch,
+                f"{path}&count={count}&start={start}",
+                headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
+            )
+        retries = getattr(res.raw, "retries", None)
+        throttled = bool(retries and retries.history)
+        if not 200 <= res.status_code < 300:
+            self.logger.error(f"Failed to fetch job search page at start {start}: status {res.status_code}")
+            raise RuntimeError(f"Job search page at start {start} failed with status {res.status_code}")
+        try:
+            data = _parse(res.content)
+        except orjson.JSONDecodeError as e:
+            self.logger.error(f"Failed to parse job search page at start {start}")
+            raise RuntimeError(f"Job search page at start {start} returned invalid JSON") from e
+
+        total = (data.get("data") or {}).get("paging", {}).get("total")
+        included = data.get("included")
+        if not included:
+            return [], throttled, total
+        new_data = [e for e in included if e.get("$type") == _JOB_POSTING_TYPE]
+        for e in new_data:
+            trackingUrn = e.get("trackingUrn")
+            if trackingUrn:
+                e["job_id"] = trackingUrn.rpartition(":")[2]
+
+        return new_data, throttled, total
     
+    def _get_easy_apply_headers(self) -> Mapping[str, str]:
+        """Return the easy apply request headers, rebuilt only when the session ID changes.
+
+        Cookies are not part of the headers: the session serializes its own cookie jar.
+        """
+        session_id = self.client.session.cookies["JSESSIONID"]
+        if self._easy_apply_headers is None or session_id != self._easy_apply_session_id:
+            headers: Dict[str, str] = dict(self._headers())
+            headers["Accept"] = "application/vnd.linkedin.normalized+json+2.1"
+            headers["csrf-token"] = session_id.replace('"', "")
+            headers["Connection"] = "keep-alive"
+            self._easy_apply_headers = MappingProxyType(headers)
+            self._easy_apply_session_id = session_id
+        return self._easy_apply_headers
+
+    def _fields_cache_path(self, job_id: str) -> Optional[Path]:
+        """Return the on-disk cache file of `job_id`, or None when disk caching does not apply."""
+        if self._fields_cache_dir is None or not str(job_id).isdigit():
+            return None
+        return self._fields_cache_dir / f"{job_id}.json"
+
+    def _get_cached_fields(self, job_id: str) -> Optional[List[Dict]]:
+        """Return a copy of the cached easy apply fields of `job_id`, looking in memory first and then on disk."""
+        with self._fields_cache_lock:
+            fields = self._fields_cache.get(job_id)
+            if fields is not None:
+                self._fields_cache.move_to_end(job_id)
+                return copy.deepcopy(fields)
+
+        path = self._fields_cache_path(job_id)
+        if path is None:
+            return None
+        try:
+            if time.time() - path.stat().st_mtime > self._FIELDS_CACHE_TTL:
+                return None
+            fields = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        self._remember_fields(job_id, fields)
+        return fields
+
+    def _remember_fields(self, job_id: str, fields: List[Dict]) -> None:
+        """Store a copy of `fields` in the in-memory LRU cache, evicting the least recently used job."""
+        fields = copy.deepcopy(fields)
+        with self._fields_cache_lock:
+            self._fields_cache[job_id] = fields
+            self._fields_cache.move_to_end(job_id)
+            if len(self._fields_cache) > self._FIELDS_CACHE_SIZE:
+                self._fields_cache.popitem(last=False)
+
+    def _cache_fields(self, job_id: str, fields: List[Dict]) -> None:
+        """Cache `fields` in memory and, when enabled, on disk."""
+        self._remember_fields(job_id, fields)
+        path = self._fields_cache_path(job_id)
+        if path is None:
+            return
+        try:
+            path.write_text(json.dumps(fields))
+        except OSError:
+            self.logger.warning(f"Failed to persist easy apply fields for job {job_id}")
+
     def get_fields_for_easy_apply(self,job_id:str) -> List[Dict]:
         """Get fields needed for easy apply jobs.
 
+        Results are cached per job ID; jobs already applied to are cached as an empty list.
+        Concurrent calls for the same job ID share a single request. Every call gets its
+        own copy of the fields, so callers may modify them freely.
+
         :param job_id: Job ID
         :type job_id: str
         :return: Fields
         :rtype: dict
         """
 
-        cookies = self.client.session.cookies.get_dict()
-        cookie_str = "; ".join([f"{k}={v}" for k, v in cookies.items()])
+        cached = self._get_cached_fields(job_id)
+        if cached is not None:
+            return cached
 
-        headers: Dict[str, str] = self._headers()
-        
+        with self._fields_cache_lock:
+            # the previous owner may have cached the fields since the lookup above
+            if job_id in self._fields_cache:
+                return copy.deepcopy(self._fields_cache[job_id])
+            in_flight = self._fields_in_flight.get(job_id)
+            if in_flight is None:
+                in_flight = self._fields_in_flight[job_id] = Future()
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            return copy.deepcopy(in_flight.result())
 
-        headers["Accept"] = "application/vnd.linkedin.normalized+json+2.1"
-        headers["csrf-token"] = cookies["JSESSIONID"].replace('"', "")
-        headers["Cookie"] = cookie_str
-        headers["Connection"] = "keep-alive"
+        try:
+            fields = self._load_fields(job_id)
+            in_flight.set_result(copy.deepcopy(fields))
+        except BaseException as e:
+            in_flight.set_exception(e)
+            raise
+        finally:
+            with self._fields_cache_lock:
+                del self._fields_in_flight[job_id]
+        return fields
 
+    def _load_fields(self, job_id: str) -> List[Dict]:
+        """Fetch and parse the easy apply fields of `job_id`, caching successful lookups."""
+        headers = self._get_easy_apply_headers()
 
         default_params = {
             "decorationId": "com.linkedin.voyager.dash.deco.jobs.OnsiteApplyApplication-67",
@@ -198,68 +641,84 @@ class LinkedInEvolvedAPI(Linkedin):
         res = self._fetch(
             f"/voyagerJobsDashOnsiteApplyApplication?{default_params}",
             headers=headers,
-            cookies=cookies,
         )
 
-        match res.status_code:
-            case 200:
-                pass
-            case 409:
-                self.logger.error("Failed to fetch fields for easy apply job because already applied to this job!")
-                return []
-            case _:
-                self.logger.error("Failed to fetch fields for easy apply job")
-                return []
+        status = res.status_code
+        if status != 200:
+            self.logger.error(
+                _EASY_APPLY_STATUS_MESSAGES.get(status, "Failed to fetch fields for easy apply job")
+            )
+            if status == 409:
+                self._cache_fields(job_id, [])
+            return []
 
         try:
-            data = res.json()
-        except ValueError:
+            data = _parse(res.content)
+        except orjson.JSONDecodeError:
             self.logger.error("Failed to parse JSON response")
             return []
         
         form_components = []
 
         for item in data.get("included", []):
-            if 'formComponent' in item:
-                urn = item['urn']
-                try:
-                    title = item['title']['text']
-                except TypeError:
-                    title = urn
-                
-                form_component_type = list(item['formComponent'].keys())[0]
-                form_component_details = item['formComponent'][form_component_type]
-                
-                component_info = {
-                    'title': title,
-                    'urn': urn,
-                    'formComponentType': form_component_type,
-                }
-                
-                if 'textSelectableOptions' in form_component_details:
-                    options = [
-                        opt['optionText']['text'] for opt in form_component_details['textSelectableOptions']
-                    ]
-                    component_info['selectableOptions'] = options
-                elif 'selectableOptions' in form_component_details:
-                    options = [
-                        opt['textSelectableOption']['optionText']['text'] 
-                        for opt in form_component_details['selectableOptions']
-                    ]
-                    component_info['selectableOptions'] = options
-                
-                form_components.append(component_info)
+            form_component = item.get('formComponent')
+            if form_component is None:
+                continue
+            urn = item['urn']
+            title = (item.get('title') or {}).get('text', urn)
+
+            form_component_type, form_component_details = next(iter(form_component.items()))
+
+            component_info = {
+                'title': title,
+                'urn': urn,
+                'formComponentType': form_component_type,
+            }
 
+            for options_field, extract_options in _OPTION_EXTRACTORS.items():
+                if options_field in form_component_details:
+                    component_info['selectableOptions'] = extract_options(
+                        form_component_details[options_field]
+                    )
+                    break
+
+            form_components.append(component_info)
+
+        self._cache_fields(job_id, form_components)
         return form_components
 
+    async def get_fields_for_easy_apply_many(self, job_ids: List[str]) -> List[List[Dict]]:
+        """Get fields needed for several easy apply jobs, fetched concurrently.
+
+        :param job_ids: Job IDs
+        :type job_ids: list
+        :return: Fields for each job, in the same order as `job_ids`
+        :rtype: list
+        """
+        semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_FIELD_FETCHES)
+
+        async def fetch_fields(job_id: str) -> List[Dict]:
+            async with semaphore:
+                return await asyncio.to_thread(self.get_fields_for_easy_apply, job_id)
+
+        unique_ids = list(dict.fromkeys(job_ids))
+        fields = await asyncio.gather(*(fetch_fields(job_id) for job_id in unique_ids))
+        fields_by_id = dict(zip(unique_ids, fields))
+        # a repeated job ID gets its own copy, like every other caller of the cache
+        results = []
+        returned = set()
+        for job_id in job_ids:
+            job_fields = fields_by_id[job_id]
+            results.append(copy.deepcopy(job_fields) if job_id in returned else job_fields)
+            returned.add(job_id)
+        return results
+
 ## EXAMPLE USAGE
 if __name__ == "__main__":
     api: LinkedInEvolvedAPI = LinkedInEvolvedAPI(username="", password="")     
     jobs = api.search_jobs(keywords="Frontend Developer", location_name="Italia", limit=5, easy_apply=True, offset=1)
-    for job in jobs:
-        job_id: str = job["job_id"]
-
-        fields = api.get_fields_for_easy_apply(job_id)
+    job_ids: List[str] = [job["job_id"] for job in jobs]
+    for fields in asyncio.run(api.get_fields_for_easy_apply_many(job_ids)):
         for field in fields:
             print(field)
 